@@ -5,58 +5,124 @@ This file is automatically imported by Python at startup and applies
 to all code including third-party libraries.
 """
 
+import importlib.abc
 import io
+import os
 import sys
 
-# Force UTF-8 for stdout/stderr globally
-if hasattr(sys.stdout, 'buffer'):
-    sys.stdout = io.TextIOWrapper(
-        sys.stdout.buffer,
-        encoding='utf-8',
-        errors='replace',
-        line_buffering=True
-    )
 
-if hasattr(sys.stderr, 'buffer'):
-    sys.stderr = io.TextIOWrapper(
-        sys.stderr.buffer,
-        encoding='utf-8',
-        errors='replace',
-        line_buffering=True
-    )
+def _is_utf8(stream):
+    encoding = getattr(stream, 'encoding', None) or ''
+    return encoding.lower().replace('-', '') == 'utf8'
+
+
+# Force UTF-8 for stdout/stderr globally
+if not getattr(sys, '_utf8_forced', False):
+    if hasattr(sys.stdout, 'buffer') and not _is_utf8(sys.stdout):
+        sys.stdout = io.TextIOWrapper(
+            sys.stdout.buffer,
+            encoding='utf-8',
+            errors='replace',
+            line_buffering=True
+        )
 
-# Monkey-patch open() to default to UTF-8
-import builtins
-_original_open = builtins.open
+    if hasattr(sys.stderr, 'buffer') and not _is_utf8(sys.stderr):
+        sys.stderr = io.TextIOWrapper(
+            sys.stderr.buffer,
+            encoding='utf-8',
+            errors='replace',
+            line_buffering=True
+        )
 
-def utf8_open(file, mode='r', *args, **kwargs):
-    """Default to UTF-8 encoding for all file operations."""
-    if 'b' not in mode and 'encoding' not in kwargs:
-        kwargs['encoding'] = 'utf-8'
-        kwargs.setdefault('errors', 'replace')
-    return _original_open(file, mode, *args, **kwargs)
+    # Let src.encoding_fix know the streams are already UTF-8
+    sys._utf8_forced = True
 
-builtins.open = utf8_open
+# File I/O defaults to UTF-8 through Python's UTF-8 mode (PYTHONUTF8=1,
+# set in the Dockerfile), which CPython applies in C for every open(). Text
+# files are decoded with errors='strict', so invalid UTF-8 raises instead of
+# being replaced; pass errors='replace' where lenient decoding is needed.
+if not sys.flags.utf8_mode:
+    # Too late for this interpreter, but child processes inherit it
+    os.environ.setdefault('PYTHONUTF8', '1')
+    sys.stderr.write(
+        'sitecustomize: Python UTF-8 mode is off; set PYTHONUTF8=1 so '
+        'open() defaults to UTF-8.\n'
+    )
 
 # Monkey-patch httpx header normalization to handle unicode
 # This fixes the OpenAI SDK bug where unicode characters in headers cause ASCII encoding errors
-try:
-    import httpx._models
-
-    _original_normalize = httpx._models._normalize_header_value
-
-    def _normalize_header_value_utf8(value, encoding=None):
-        """Normalize header value with UTF-8 support instead of ASCII-only."""
-        if isinstance(value, bytes):
-            return value
-        elif isinstance(value, str):
-            # Force UTF-8 encoding with error replacement instead of ASCII
-            return value.encode('utf-8', errors='replace')
+def _normalize_header_value_utf8(value, encoding=None):
+    """Normalize header value with UTF-8 support instead of ASCII-only."""
+    if type(value) is bytes:
+        return value
+    if type(value) is str:
+        # Most header values are plain ASCII; only fall back to UTF-8 otherwise
+        if value.isascii():
+            return value.encode('ascii')
+        return value.encode('utf-8', errors='replace')
+    # Subclasses (e.g. str-based enums) keep their own value, as before the fast paths
+    if isinstance(value, bytes):
+        return value
+    if isinstance(value, str):
+        return value.encode('utf-8', errors='replace')
+    # Handle other types (int, etc)
+    return str(value).encode('utf-8', errors='replace')
+
+
+def _patch_httpx_models(module):
+    module._normalize_header_value = _normalize_header_value_utf8
+
+
+class _HttpxPatcher(importlib.abc.MetaPathFinder):
+    """Apply the header patch the first time httpx._models is imported.
+
+    Importing httpx eagerly here would pay its full import cost in every
+    Python process, so the patch is deferred until the application needs it.
+    """
+
+    _target = 'httpx._models'
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname != self._target:
+            return None
+        for finder in sys.meta_path:
+            if finder is self:
+                continue
+            find_spec = getattr(finder, 'find_spec', None)
+            if find_spec is None:
+                continue
+            spec = find_spec(fullname, path, target)
+            if spec is not None:
+                break
         else:
-            # Handle other types (int, etc)
-            return str(value).encode('utf-8', errors='replace')
+            return None
+        loader = spec.loader
+        if loader is None or not hasattr(loader, 'exec_module'):
+            return spec
+        original_exec_module = loader.exec_module
+
+        class _PatchingLoader(importlib.abc.Loader):
+            def create_module(self, spec):
+                return loader.create_module(spec)
+
+            def exec_module(self, module):
+                original_exec_module(module)
+                _patch_httpx_models(module)
+
+            def __getattr__(self, name):
+                # Keep get_code, get_source, get_resource_reader etc. of the real loader
+                return getattr(loader, name)
+
+        spec.loader = _PatchingLoader()
+        # The patch only needs to be installed once per process.
+        try:
+            sys.meta_path.remove(self)
+        except ValueError:
+            pass
+        return spec
+
 
-    httpx._models._normalize_header_value = _normalize_header_value_utf8
-except ImportError:
-    # httpx not installed yet, will be patched when it loads
-    pass
+if 'httpx._models' in sys.modules:
+    _patch_httpx_models(sys.modules['httpx._models'])
+else:
+    sys.meta_path.insert(0, _HttpxPatcher())
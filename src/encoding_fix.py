@@ -8,42 +8,63 @@ import io
 import locale
 import sys
 
-# Reconfigure stdout and stderr to use UTF-8
-if hasattr(sys.stdout, 'reconfigure'):
-    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
-if hasattr(sys.stderr, 'reconfigure'):
-    sys.stderr.reconfigure(encoding='utf-8', errors='replace')
-
-# Override sys.stdout/stderr with UTF-8 wrappers for older Python
-if sys.stdout.encoding != 'utf-8':
-    sys.stdout = io.TextIOWrapper(
-        sys.stdout.buffer,
-        encoding='utf-8',
-        errors='replace',
-        line_buffering=True
-    )
-
-if sys.stderr.encoding != 'utf-8':
-    sys.stderr = io.TextIOWrapper(
-        sys.stderr.buffer,
-        encoding='utf-8',
-        errors='replace',
-        line_buffering=True
-    )
-
-# Set default encoding for string operations
-if hasattr(sys, 'setdefaultencoding'):
-    sys.setdefaultencoding('utf-8')  # type: ignore
-
-# Set locale
-try:
-    locale.setlocale(locale.LC_ALL, 'C.UTF-8')
-except locale.Error:
+
+def _is_utf8(stream) -> bool:
+    encoding = getattr(stream, 'encoding', None) or ''
+    return encoding.lower().replace('-', '') == 'utf8'
+
+
+# sitecustomize.py sets this sentinel once stdio is UTF-8, so the
+# stream setup below only runs when it was not installed.
+if not getattr(sys, '_utf8_forced', False):
+    # Reconfigure stdout and stderr to use UTF-8
+    if hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+    if hasattr(sys.stderr, 'reconfigure'):
+        sys.stderr.reconfigure(encoding='utf-8', errors='replace')
+
+    # Override sys.stdout/stderr with UTF-8 wrappers for older Python
+    if not _is_utf8(sys.stdout):
+        sys.stdout = io.TextIOWrapper(
+            sys.stdout.buffer,
+            encoding='utf-8',
+            errors='replace',
+            line_buffering=True
+        )
+
+    if not _is_utf8(sys.stderr):
+        sys.stderr = io.TextIOWrapper(
+            sys.stderr.buffer,
+            encoding='utf-8',
+            errors='replace',
+            line_buffering=True
+        )
+
+    # Set default encoding for string operations
+    if hasattr(sys, 'setdefaultencoding'):
+        sys.setdefaultencoding('utf-8')  # type: ignore
+
+    sys._utf8_forced = True  # type: ignore[attr-defined]
+
+
+def _set_utf8_locale():
+    """Try the UTF-8 locales in order and return the one that was applied."""
+    try:
+        return locale.setlocale(locale.LC_ALL, 'C.UTF-8')
+    except locale.Error:
+        pass
     try:
-        locale.setlocale(locale.LC_ALL, 'en_US.UTF-8')
+        return locale.setlocale(locale.LC_ALL, 'en_US.UTF-8')
     except locale.Error:
-        # Fall back to setting just LC_CTYPE
-        try:
-            locale.setlocale(locale.LC_CTYPE, 'C.UTF-8')
-        except locale.Error:
-            pass
+        pass
+    # Fall back to setting just LC_CTYPE
+    try:
+        return locale.setlocale(locale.LC_CTYPE, 'C.UTF-8')
+    except locale.Error:
+        return None
+
+
+# Set locale once per process; the result is cached on sys. UTF-8 mode
+# already makes Python I/O independent of the locale, so skip it there.
+if not sys.flags.utf8_mode and not hasattr(sys, '_utf8_locale_set'):
+    sys._utf8_locale_set = _set_utf8_locale()  # type: ignore[attr-defined]
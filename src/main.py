@@ -6,29 +6,63 @@ from __future__ import annotations
 import src.encoding_fix  # noqa: F401
 
 import asyncio
+import hashlib
+import inspect
+import io
 import logging
 import os
 import secrets
+import sys
+import time
 import uuid
-from datetime import datetime, timezone
-from typing import Any, Dict, Optional
-
-from dotenv import load_dotenv
-from fastapi import Depends, FastAPI, Header, HTTPException
-from fastapi.responses import JSONResponse
+from collections import deque
+from contextlib import asynccontextmanager, suppress
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Optional
+
+import orjson
+from fastapi import Depends, FastAPI, Header, HTTPException, Request
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel, ConfigDict, model_validator
 from starlette.concurrency import run_in_threadpool
 
 from src import __version__
-from src.services import DeepevalWrapperClient, DeepevalWrapperError
+from src.services.errors import DeepevalWrapperError
+
+if TYPE_CHECKING:
+    from src.services import DeepevalWrapperClient
+
+# Load environment variables early so the wrapper client sees them. Containers
+# usually inject env vars directly, so only import dotenv when a .env is present.
+# The path is anchored to the project root so it does not depend on the cwd.
+_DOTENV_PATH = Path(__file__).resolve().parents[1] / ".env"
+if _DOTENV_PATH.is_file() and not os.environ.get("SKIP_DOTENV"):
+    from dotenv import load_dotenv
 
-# Load environment variables early so the wrapper client sees them.
-load_dotenv()
+    load_dotenv(_DOTENV_PATH)
 
 # Configure structured logging for the service.
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("deepeval_mcp")
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Build the wrapper client on boot and release it on shutdown."""
+    app.state.wrapper_client = None
+    app.state.ping_is_async = False
+    await startup(app)
+    # Started after startup() so a failed boot leaves no task behind
+    app.state.uuid_refill_task = asyncio.create_task(_uuid_pool_producer())
+    try:
+        yield
+    finally:
+        app.state.uuid_refill_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await app.state.uuid_refill_task
+        await shutdown(app)
+
+
 app = FastAPI(
     title="Deepeval MCP Bridge",
     description=(
@@ -36,79 +70,111 @@ app = FastAPI(
         "Also provides direct access to the deepeval-wrapper endpoints at /wrapper/*"
     ),
     version=__version__,
+    lifespan=lifespan,
+)
+# Defaults for when the app is served without running the lifespan
+app.state.wrapper_client = None
+app.state.ping_is_async = False
+
+# Static discovery document served at the root endpoint
+_ROOT_PAYLOAD: Dict[str, Any] = {
+    "service": "DeepEval MCP Bridge",
+    "version": __version__,
+    "endpoints": {
+        "mcp_api": {
+            "docs": "/docs",
+            "description": "Synchronous evaluation endpoints with MCP-formatted responses",
+            "endpoints": {
+                "evaluate": "POST /mcp/evaluate - Run evaluation with MCP formatting",
+                "metrics_list": "GET /mcp/metrics - List all available metrics",
+                "metrics_categories": "GET /mcp/metrics/categories - Get metrics by category",
+                "metric_info": "GET /mcp/metrics/{metric_type} - Get metric details",
+            },
+        },
+        "wrapper_api": {
+            "docs": "/wrapper/docs",
+            "description": "Direct access to all deepeval-wrapper functionality",
+            "synchronous": {
+                "evaluate": "POST /wrapper/evaluate/ - Single evaluation",
+                "bulk": "POST /wrapper/evaluate/bulk - Bulk evaluations",
+                "metrics": "GET /wrapper/metrics/ - List metrics",
+            },
+            "asynchronous": {
+                "note": "These create jobs and return immediately with job IDs",
+                "evaluate_async": "POST /wrapper/evaluate/async - Async single evaluation",
+                "bulk_async": "POST /wrapper/evaluate/async/bulk - Async bulk evaluation",
+                "dataset": "POST /wrapper/evaluate/dataset - Evaluate dataset file",
+                "jobs": "GET /wrapper/jobs/ - List all jobs",
+                "job_status": "GET /wrapper/jobs/{job_id} - Get job status",
+                "job_cancel": "POST /wrapper/jobs/{job_id}/cancel - Cancel job",
+                "job_delete": "DELETE /wrapper/jobs/{job_id} - Delete job",
+            },
+        },
+    },
+    "recommendations": {
+        "quick_evaluations": "Use /mcp/* endpoints for immediate results with MCP formatting",
+        "batch_processing": "Use /wrapper/evaluate/async/bulk for large batches",
+        "direct_access": "Use /wrapper/* for advanced features and job management",
+    },
+}
+
+# The payload never changes, so serialise it once instead of on every request
+_ROOT_RESPONSE = Response(
+    content=orjson.dumps(_ROOT_PAYLOAD),
+    media_type="application/json",
 )
 
+
 # Root endpoint with helpful navigation
 @app.get("/", include_in_schema=True)
-async def root() -> Dict[str, Any]:
+async def root() -> Response:
     """Root endpoint with links to available APIs."""
-    return {
-        "service": "DeepEval MCP Bridge",
-        "version": __version__,
-        "endpoints": {
-            "mcp_api": {
-                "docs": "/docs",
-                "description": "Synchronous evaluation endpoints with MCP-formatted responses",
-                "endpoints": {
-                    "evaluate": "POST /mcp/evaluate - Run evaluation with MCP formatting",
-                    "metrics_list": "GET /mcp/metrics - List all available metrics",
-                    "metrics_categories": "GET /mcp/metrics/categories - Get metrics by category",
-                    "metric_info": "GET /mcp/metrics/{metric_type} - Get metric details",
-                },
-            },
-            "wrapper_api": {
-                "docs": "/wrapper/docs",
-                "description": "Direct access to all deepeval-wrapper functionality",
-                "synchronous": {
-                    "evaluate": "POST /wrapper/evaluate/ - Single evaluation",
-                    "bulk": "POST /wrapper/evaluate/bulk - Bulk evaluations",
-                    "metrics": "GET /wrapper/metrics/ - List metrics",
-                },
-                "asynchronous": {
-                    "note": "These create jobs and return immediately with job IDs",
-                    "evaluate_async": "POST /wrapper/evaluate/async - Async single evaluation",
-                    "bulk_async": "POST /wrapper/evaluate/async/bulk - Async bulk evaluation",
-                    "dataset": "POST /wrapper/evaluate/dataset - Evaluate dataset file",
-                    "jobs": "GET /wrapper/jobs/ - List all jobs",
-                    "job_status": "GET /wrapper/jobs/{job_id} - Get job status",
-                    "job_cancel": "POST /wrapper/jobs/{job_id}/cancel - Cancel job",
-                    "job_delete": "DELETE /wrapper/jobs/{job_id} - Delete job",
-                },
-            },
-        },
-        "recommendations": {
-            "quick_evaluations": "Use /mcp/* endpoints for immediate results with MCP formatting",
-            "batch_processing": "Use /wrapper/evaluate/async/bulk for large batches",
-            "direct_access": "Use /wrapper/* for advanced features and job management",
-        },
-    }
+    return _ROOT_RESPONSE
+
+# Constant probe bodies, built once because health checks hit them every few seconds
+_HEALTH_OK = Response(content=b'{"status":"ok"}', media_type="application/json")
+_HEALTHZ_UNINITIALISED = Response(
+    content=b'{"status":"ok","wrapper":{"status":"uninitialised"}}',
+    media_type="application/json",
+)
+
 
 # Simple liveness endpoint to satisfy container/infra health checks
 @app.get("/health", include_in_schema=False)
-async def health() -> Dict[str, Any]:
-    return {"status": "ok"}
-
-wrapper_client: Optional[DeepevalWrapperClient] = None
+async def health() -> Response:
+    return _HEALTH_OK
 
 # Parse API_KEYS as comma-separated list for MCP endpoint authentication
-raw_api_keys = os.getenv("API_KEYS", "").strip()
-api_keys_list: list[str] = [key.strip() for key in raw_api_keys.split(",") if key.strip()] if raw_api_keys else []
+raw_api_keys = os.getenv("API_KEYS", "").encode()
+api_keys_set: frozenset[bytes] = frozenset(
+    key for key in (part.strip() for part in raw_api_keys.split(b",")) if key
+)
+# SHA-256 digest -> key, so a request is checked with one lookup instead of a scan
+_api_key_hashes: dict[bytes, bytes] = {
+    hashlib.sha256(key).digest(): key for key in api_keys_set
+}
 
 
-def require_api_key(x_api_key: Optional[str] = Header(default=None, alias="X-API-Key")) -> None:
-    """Verify that the incoming request carries a valid API key from the configured list."""
-    if not api_keys_list:
-        # No API keys configured - authentication disabled
+# Pick the dependency once at import so requests never re-check whether auth is configured
+if not api_keys_set:
+    def require_api_key() -> None:
+        """No API keys configured - authentication disabled."""
         return
 
-    if x_api_key is None:
-        logger.warning("API key authentication failed: No X-API-Key header provided.")
-        raise HTTPException(status_code=401, detail="Invalid API key")
+else:
+    def require_api_key(x_api_key: Optional[str] = Header(default=None, alias="X-API-Key")) -> None:
+        """Verify that the incoming request carries a valid API key from the configured list."""
+        if x_api_key is None:
+            logger.warning("API key authentication failed: No X-API-Key header provided.")
+            raise HTTPException(status_code=401, detail="Invalid API key")
 
-    # Check if provided key matches any configured key using constant-time comparison
-    if not any(secrets.compare_digest(x_api_key, valid_key) for valid_key in api_keys_list):
-        logger.warning("API key authentication failed: Key not in authorized list.")
-        raise HTTPException(status_code=401, detail="Invalid API key")
+        # Starlette decodes headers as latin-1, so re-encoding recovers the raw header
+        # bytes. Look up the key by digest, then confirm with a constant-time comparison.
+        presented = x_api_key.encode("latin-1")
+        candidate = _api_key_hashes.get(hashlib.sha256(presented).digest())
+        if candidate is None or not secrets.compare_digest(presented, candidate):
+            logger.warning("API key authentication failed: Key not in authorized list.")
+            raise HTTPException(status_code=401, detail="Invalid API key")
 
 
 class EvaluationRequest(BaseModel):
@@ -121,32 +187,80 @@ class EvaluationRequest(BaseModel):
     @model_validator(mode="before")
     @classmethod
     def ensure_data_wrapper(cls, values: Any) -> Any:
-        if isinstance(values, dict) and "data" not in values:
+        # FastAPI validates bodies through a TypeAdapter, not model_validate(),
+        # so the wrapping has to live in a validator. Decoded JSON bodies are
+        # plain dicts, and already-wrapped payloads are returned untouched.
+        if type(values) is dict and "data" not in values:
             return {"data": values}
         return values
 
 
-def _get_wrapper() -> DeepevalWrapperClient:
-    if wrapper_client is None:
+def _get_wrapper(request: Request) -> DeepevalWrapperClient:
+    """Dependency returning the wrapper client built by the lifespan handler."""
+    wrapper = request.app.state.wrapper_client
+    if wrapper is None:
         raise HTTPException(status_code=503, detail="Wrapper client not initialised.")
-    return wrapper_client
+    return wrapper
+
+
+_UUID_POOL_SIZE = 256
+_UUID_POOL_LOW_WATERMARK = 256
+_UUID_POOL_REFILL = 768
+_UUID_POOL_REFILL_INTERVAL = 0.05
+_uuid_pool: deque[str] = deque()
+
+
+def _refill_uuid_pool(count: int) -> None:
+    """Append ``count`` UUID4 strings generated from a single os.urandom call."""
+    buf = os.urandom(16 * count)
+    _uuid_pool.extend(
+        str(uuid.UUID(bytes=buf[i:i + 16], version=4))
+        for i in range(0, len(buf), 16)
+    )
 
 
-def _mcp_response(data: Dict[str, Any]) -> tuple[Dict[str, Any], str]:
-    """Return a JSON MCP result envelope."""
-    request_id = str(uuid.uuid4())
+def _fast_uuid() -> str:
+    """Return a random UUID4 string from the pre-generated pool."""
+    try:
+        return _uuid_pool.popleft()
+    except IndexError:
+        # Producer not running (or outpaced); refill inline
+        _refill_uuid_pool(_UUID_POOL_SIZE)
+        return _uuid_pool.popleft()
+
+
+async def _uuid_pool_producer() -> None:
+    """Keep the UUID pool topped up so request handlers never hit os.urandom."""
+    while True:
+        if len(_uuid_pool) < _UUID_POOL_LOW_WATERMARK:
+            _refill_uuid_pool(_UUID_POOL_REFILL)
+        await asyncio.sleep(_UUID_POOL_REFILL_INTERVAL)
+
+
+def _fast_iso_utc() -> str:
+    """Return the current UTC time in ISO 8601 format without a datetime object."""
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    tm = time.gmtime(seconds)
+    return (
+        f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}T"
+        f"{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}.{nanos // 1000:06d}+00:00"
+    )
+
+
+def _mcp_response(data: Dict[str, Any], x_request_id: Optional[str] = None) -> tuple[Dict[str, Any], str]:
+    """Return a JSON MCP result envelope, reusing the caller's request ID when given."""
+    request_id = x_request_id or _fast_uuid()
     return {
         "type": "mcp.result",
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": _fast_iso_utc(),
         "provider": "deepeval",
         "request_id": request_id,
         "data": data,
     }, request_id
 
 
-def print_startup_banner():
-    """Print a fancy startup banner with service information."""
-    banner = """
+# Pre-encoded once so the banner goes out in a single write
+_STARTUP_BANNER: bytes = """
 ╔══════════════════════════════════════════════════════════════════════╗
 ║                                                                      ║
 ║              🚀 DeepEval MCP Bridge Server 🚀                        ║
@@ -172,27 +286,40 @@ def print_startup_banner():
    ✓ Async job management via /wrapper/jobs/*
    ✓ Comprehensive logging and error handling
 
-"""
-    # Print to stdout so it appears in docker logs
-    print(banner, flush=True)
 
+""".encode("utf-8")
+
+
+def _write_stdout(data: bytes) -> None:
+    """Write pre-encoded bytes to stdout in one call so they appear in docker logs."""
+    stream = sys.stdout
+    buffer = getattr(stream, "buffer", None)
+    if buffer is None:
+        stream.write(data.decode("utf-8"))
+        stream.flush()
+        return
+    # Flush anything pending in the text layer to keep output ordered
+    stream.flush()
+    buffer.write(data)
+    buffer.flush()
+
+
+def print_startup_banner():
+    """Print a fancy startup banner with service information."""
+    _write_stdout(_STARTUP_BANNER)
 
-@app.on_event("startup")
-async def startup() -> None:
-    """Initialise the Deepeval wrapper client when the app boots."""
-    global wrapper_client
 
+async def startup(app: FastAPI) -> None:
+    """Initialise the Deepeval wrapper client when the app boots."""
     # Print fancy startup banner
     print_startup_banner()
 
     # Check for at least one LLM API key
-    llm_keys = {
-        "OPENAI_API_KEY": os.getenv("OPENAI_API_KEY", "").strip(),
-        "ANTHROPIC_API_KEY": os.getenv("ANTHROPIC_API_KEY", "").strip(),
-        "GOOGLE_API_KEY": os.getenv("GOOGLE_API_KEY", "").strip(),
-    }
-
-    configured_keys = [name for name, value in llm_keys.items() if value]
+    configured_keys = [
+        name
+        for name in ("OPENAI_API_KEY", "ANTHROPIC_API_KEY", "GOOGLE_API_KEY")
+        if os.environ.get(name, "").strip()
+    ]
 
     if not configured_keys:
         logger.error(
@@ -206,8 +333,8 @@ async def startup() -> None:
     logger.info("LLM API keys configured: %s", ", ".join(configured_keys))
 
     # Log API authentication status
-    if api_keys_list:
-        logger.info("API authentication enabled: %d key(s) configured for /mcp/* and /wrapper/* endpoints", len(api_keys_list))
+    if api_keys_set:
+        logger.info("API authentication enabled: %d key(s) configured for /mcp/* and /wrapper/* endpoints", len(api_keys_set))
     else:
         logger.warning(
             "API authentication DISABLED: No API_KEYS configured. "
@@ -226,42 +353,47 @@ async def startup() -> None:
 
     logger.debug("Initialising wrapper client on startup.")
     try:
-        wrapper_client = DeepevalWrapperClient(expose_wrapper_app=True)
+        from src.services import DeepevalWrapperClient
+
+        wrapper_client = await DeepevalWrapperClient.get()
+        app.state.wrapper_client = wrapper_client
         logger.info("Wrapper client initialised.")
+        # Async pings are awaited directly in /healthz instead of via the threadpool
+        app.state.ping_is_async = inspect.iscoroutinefunction(getattr(wrapper_client, "ping", None))
 
         # Mount the wrapper's FastAPI app to expose all its endpoints directly
-        if wrapper_client.wrapper_app:
-            app.mount("/wrapper", wrapper_client.wrapper_app)
-            logger.info("Wrapper app mounted at /wrapper - all wrapper endpoints are now accessible!")
-            logger.info("Available wrapper routes: /wrapper/evaluate/, /wrapper/metrics/, /wrapper/jobs/, etc.")
+        wrapper_client.mount(app)
+        logger.info("Wrapper app mounted at /wrapper - all wrapper endpoints are now accessible!")
+        logger.info("Available wrapper routes: /wrapper/evaluate/, /wrapper/metrics/, /wrapper/jobs/, etc.")
     except Exception:
         # Do not crash the container; surface the failure via logs and /healthz
         logger.exception(
             "Failed to initialise Deepeval wrapper client. "
             "Service will stay up, but /mcp/* and /wrapper/* will return 503."
         )
-        wrapper_client = None
+        app.state.wrapper_client = None
         return
 
     # Print startup completion
-    print("\n" + "="*70)
-    print("✅ Server initialization complete!")
-    print("="*70)
-    print(f"🌐 Server will be available at: http://0.0.0.0:8000")
-    print(f"📊 Health check endpoint:       http://0.0.0.0:8000/health")
-    print(f"🔑 Configured LLM providers:    {', '.join(configured_keys)}")
-    print(f"📦 DeepEval version:            {deepeval_version}")
-    if api_keys_list:
-        print(f"🔐 API authentication:          ENABLED ({len(api_keys_list)} key(s))")
+    summary = io.StringIO()
+    summary.write("\n" + "="*70 + "\n")
+    summary.write("✅ Server initialization complete!\n")
+    summary.write("="*70 + "\n")
+    summary.write("🌐 Server will be available at: http://0.0.0.0:8000\n")
+    summary.write("📊 Health check endpoint:       http://0.0.0.0:8000/health\n")
+    summary.write(f"🔑 Configured LLM providers:    {', '.join(configured_keys)}\n")
+    summary.write(f"📦 DeepEval version:            {deepeval_version}\n")
+    if api_keys_set:
+        summary.write(f"🔐 API authentication:          ENABLED ({len(api_keys_set)} key(s))\n")
     else:
-        print(f"⚠️  API authentication:          DISABLED (set API_KEYS to enable)")
-    print("="*70 + "\n", flush=True)
+        summary.write("⚠️  API authentication:          DISABLED (set API_KEYS to enable)\n")
+    summary.write("="*70 + "\n\n")
+    _write_stdout(summary.getvalue().encode("utf-8"))
 
 
-@app.on_event("shutdown")
-async def shutdown() -> None:
+async def shutdown(app: FastAPI) -> None:
     """Release wrapper resources during application shutdown."""
-    global wrapper_client
+    wrapper_client = app.state.wrapper_client
     if wrapper_client is None:
         return
     logger.debug("Shutting down wrapper client.")
@@ -270,30 +402,38 @@ async def shutdown() -> None:
     except Exception:  # noqa: BLE001 - best-effort cleanup
         logger.warning("Wrapper client close() failed.", exc_info=True)
     logger.info("Wrapper client shutdown complete.")
-    wrapper_client = None
+    app.state.wrapper_client = None
 
 
 @app.post("/mcp/evaluate")
-async def mcp_evaluate(payload: EvaluationRequest, _: None = Depends(require_api_key)) -> JSONResponse:
+async def mcp_evaluate(
+    payload: EvaluationRequest,
+    _: None = Depends(require_api_key),
+    wrapper: DeepevalWrapperClient = Depends(_get_wrapper),
+    x_request_id: Optional[str] = Header(default=None, alias="X-Request-ID"),
+) -> ORJSONResponse:
     """Run a Deepeval evaluation and wrap the result in an MCP response."""
-    wrapper = _get_wrapper()
-    logger.info("Received evaluation request with data: %s", payload.data)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Received evaluation request with data: %s", payload.data)
+    elif logger.isEnabledFor(logging.INFO):
+        logger.info("Received evaluation request with keys: %s", list(payload.data))
     try:
-        logger.info("Calling wrapper.evaluate() via ASGI...")
-        result = await asyncio.wait_for(wrapper.evaluate(payload.data), timeout=30)
+        logger.info("Calling wrapper.evaluate()...")
+        async with asyncio.timeout(30):
+            result = await wrapper.evaluate(payload.data)
         logger.info("Wrapper evaluate completed successfully")
     except DeepevalWrapperError as exc:
         logger.error("Deepeval evaluation failed: %s", str(exc), exc_info=True)
         raise HTTPException(status_code=502, detail=str(exc)) from exc
-    except asyncio.TimeoutError as exc:
+    except TimeoutError as exc:
         logger.error("Deepeval evaluation timed out after 30s", exc_info=True)
         raise HTTPException(status_code=504, detail="Wrapper call timed out") from exc
     except Exception as exc:
         logger.error("Unexpected error during evaluation: %s", str(exc), exc_info=True)
         raise HTTPException(status_code=500, detail=f"Evaluation error: {str(exc)}") from exc
 
-    content, request_id = _mcp_response(result)
-    return JSONResponse(
+    content, request_id = _mcp_response(result, x_request_id)
+    return ORJSONResponse(
         status_code=200,
         content=content,
         headers={"X-Request-ID": request_id},
@@ -301,20 +441,24 @@ async def mcp_evaluate(payload: EvaluationRequest, _: None = Depends(require_api
 
 
 @app.get("/mcp/metrics")
-async def mcp_metrics(_: None = Depends(require_api_key)) -> JSONResponse:
+async def mcp_metrics(
+    _: None = Depends(require_api_key),
+    wrapper: DeepevalWrapperClient = Depends(_get_wrapper),
+    x_request_id: Optional[str] = Header(default=None, alias="X-Request-ID"),
+) -> ORJSONResponse:
     """List all available metrics with MCP formatting."""
-    wrapper = _get_wrapper()
     try:
-        metrics = await asyncio.wait_for(wrapper.available_metrics(), timeout=30)
+        async with asyncio.timeout(30):
+            metrics = await wrapper.available_metrics()
     except DeepevalWrapperError as exc:
         logger.error("Deepeval metrics lookup failed.", exc_info=True)
         raise HTTPException(status_code=502, detail=str(exc)) from exc
-    except asyncio.TimeoutError as exc:
+    except TimeoutError as exc:
         logger.error("Deepeval metrics request timed out.", exc_info=True)
         raise HTTPException(status_code=504, detail="Wrapper call timed out") from exc
 
-    content, request_id = _mcp_response(metrics)
-    return JSONResponse(
+    content, request_id = _mcp_response(metrics, x_request_id)
+    return ORJSONResponse(
         status_code=200,
         content=content,
         headers={"X-Request-ID": request_id},
@@ -322,17 +466,20 @@ async def mcp_metrics(_: None = Depends(require_api_key)) -> JSONResponse:
 
 
 @app.get("/mcp/metrics/categories")
-async def mcp_metrics_categories(_: None = Depends(require_api_key)) -> JSONResponse:
+async def mcp_metrics_categories(
+    _: None = Depends(require_api_key),
+    wrapper: DeepevalWrapperClient = Depends(_get_wrapper),
+    x_request_id: Optional[str] = Header(default=None, alias="X-Request-ID"),
+) -> ORJSONResponse:
     """Get metrics organized by category with MCP formatting."""
-    wrapper = _get_wrapper()
     try:
         response = await wrapper._asgi_request("GET", "/metrics/categories")
     except DeepevalWrapperError as exc:
         logger.error("Metrics categories lookup failed.", exc_info=True)
         raise HTTPException(status_code=502, detail=str(exc)) from exc
 
-    content, request_id = _mcp_response(response)
-    return JSONResponse(
+    content, request_id = _mcp_response(response, x_request_id)
+    return ORJSONResponse(
         status_code=200,
         content=content,
         headers={"X-Request-ID": request_id},
@@ -340,17 +487,21 @@ async def mcp_metrics_categories(_: None = Depends(require_api_key)) -> JSONResp
 
 
 @app.get("/mcp/metrics/{metric_type}")
-async def mcp_metric_info(metric_type: str, _: None = Depends(require_api_key)) -> JSONResponse:
+async def mcp_metric_info(
+    metric_type: str,
+    _: None = Depends(require_api_key),
+    wrapper: DeepevalWrapperClient = Depends(_get_wrapper),
+    x_request_id: Optional[str] = Header(default=None, alias="X-Request-ID"),
+) -> ORJSONResponse:
     """Get detailed information about a specific metric with MCP formatting."""
-    wrapper = _get_wrapper()
     try:
         response = await wrapper._asgi_request("GET", f"/metrics/{metric_type}")
     except DeepevalWrapperError as exc:
         logger.error("Metric info lookup failed for %s.", metric_type, exc_info=True)
         raise HTTPException(status_code=502, detail=str(exc)) from exc
 
-    content, request_id = _mcp_response(response)
-    return JSONResponse(
+    content, request_id = _mcp_response(response, x_request_id)
+    return ORJSONResponse(
         status_code=200,
         content=content,
         headers={"X-Request-ID": request_id},
@@ -358,21 +509,26 @@ async def mcp_metric_info(metric_type: str, _: None = Depends(require_api_key))
 
 
 @app.get("/healthz", include_in_schema=False)
-async def healthz() -> Dict[str, Any]:
+async def healthz(request: Request) -> Any:
     """Lightweight container liveness probe."""
-    wrapper_status: Dict[str, Any] = {"status": "uninitialised"}
-    if wrapper_client is not None:
-        wrapper_status = {"status": "ready"}
-        ping_callable = getattr(wrapper_client, "ping", None)
-        if callable(ping_callable):
-            try:
+    wrapper_client = request.app.state.wrapper_client
+    if wrapper_client is None:
+        return _HEALTHZ_UNINITIALISED
+
+    wrapper_status: Dict[str, Any] = {"status": "ready"}
+    ping_callable = getattr(wrapper_client, "ping", None)
+    if callable(ping_callable):
+        try:
+            if request.app.state.ping_is_async:
+                ping_result = await ping_callable()
+            else:
                 ping_result = await run_in_threadpool(ping_callable)
-                wrapper_status["result"] = ping_result
-            except DeepevalWrapperError as exc:
-                logger.error("Wrapper ping failed.", exc_info=True)
-                wrapper_status = {"status": "error", "detail": str(exc)}
-            except Exception as exc:  # noqa: BLE001 - surface unexpected failures
-                logger.error("Unexpected wrapper ping failure.", exc_info=True)
-                wrapper_status = {"status": "error", "detail": str(exc)}
+            wrapper_status["result"] = ping_result
+        except DeepevalWrapperError as exc:
+            logger.error("Wrapper ping failed.", exc_info=True)
+            wrapper_status = {"status": "error", "detail": str(exc)}
+        except Exception as exc:  # noqa: BLE001 - surface unexpected failures
+            logger.error("Unexpected wrapper ping failure.", exc_info=True)
+            wrapper_status = {"status": "error", "detail": str(exc)}
 
     return {"status": "ok", "wrapper": wrapper_status}
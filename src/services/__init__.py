@@ -1,5 +1,22 @@
 """Service-layer helpers for the Deepeval MCP adapter."""
 
-from .deepeval_client import DeepevalWrapperClient, DeepevalWrapperError
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from .errors import DeepevalWrapperError
+
+if TYPE_CHECKING:
+    from .deepeval_client import DeepevalWrapperClient
 
 __all__ = ["DeepevalWrapperClient", "DeepevalWrapperError"]
+
+
+def __getattr__(name: str) -> Any:
+    # Import the client module on first access so importing the package stays cheap
+    if name == "DeepevalWrapperClient":
+        from .deepeval_client import DeepevalWrapperClient
+
+        globals()[name] = DeepevalWrapperClient
+        return DeepevalWrapperClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,110 +1,192 @@
 """Client helpers for calling into the embedded deepeval-wrapper project.
 
 The client instantiates the wrapper FastAPI application in-process and
-executes requests against it via ASGI, avoiding any outbound HTTP sockets.
+executes requests against it without any outbound HTTP sockets: plain
+wrapper routes are awaited directly, everything else goes through ASGI.
+The wrapper is imported lazily on first use (or during host app startup)
+so constructing the client is cheap.
 """
 
 from __future__ import annotations
 
+import asyncio
 import importlib
+import importlib.util
+import json
 import logging
 import os
+import sys
 import traceback
 from types import ModuleType
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Optional
 
-import httpx
-from fastapi import FastAPI
-from uvicorn.importer import import_from_string
+import orjson
+
+from .errors import DeepevalWrapperError
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
+# httpx, fastapi and uvicorn are imported where they are used so that
+# importing this module stays cheap until the wrapper is actually needed.
+if TYPE_CHECKING:
+    import httpx
+    from fastapi import FastAPI
+    from fastapi.routing import APIRoute
 
 logger = logging.getLogger(__name__)
 
-# SECURITY: Override the wrapper's insecure default API key
-# The wrapper defaults to "deepeval-default-key" which is publicly known and insecure.
-# If API_KEYS is not set, we set it to empty string to disable wrapper auth entirely.
-# This is safer than leaving a known default key active.
-if "API_KEYS" not in os.environ:
-    logger.warning(
-        "API_KEYS not set - disabling wrapper authentication by setting API_KEYS to empty string. "
-        "The wrapper's default 'deepeval-default-key' is publicly known and insecure. "
-        "Set API_KEYS in your .env file to enable authentication for /wrapper/* endpoints."
-    )
-    os.environ["API_KEYS"] = ""
+# Attribute and factory names probed when locating the wrapper's ASGI app
+_ASGI_APP_ATTRS = ("app", "application", "asgi_app", "fastapi_app")
+_ASGI_APP_FACTORIES = ("create_app", "build_app", "get_app", "make_app")
+
+# Common wrapper locations tried after the configured ASGI targets
+_FALLBACK_ASGI_TARGETS = ("app.main:app", "app:app")
+
+# Wrapper endpoints that evaluate() and available_metrics() may call directly
+_DIRECT_ROUTE_KEYS = (("POST", "/evaluate/"), ("GET", "/metrics/"))
+
+# Shared clients keyed by wrapper import path; see DeepevalWrapperClient.get()
+_SINGLETONS: dict[str, DeepevalWrapperClient] = {}
 
 
-class DeepevalWrapperError(RuntimeError):
-    """Raised when the deepeval wrapper cannot be reached or returns an error."""
+def _dump_payload(payload: dict[str, Any]) -> bytes:
+    """Serialise a request body with orjson, falling back to json for what it rejects."""
+    try:
+        return orjson.dumps(payload)
+    except TypeError:
+        # orjson refuses e.g. integers wider than 64 bits, which json handles
+        try:
+            return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        except (TypeError, ValueError) as exc:
+            raise DeepevalWrapperError(f"Request payload is not JSON serialisable: {exc}") from exc
 
 
 class DeepevalWrapperClient:
     """Thin adapter around the existing deepeval-wrapper project."""
 
+    _env_configured = False
+    # Resolved wrapper modules keyed by requested import path, shared across instances
+    _MODULE_CACHE: dict[str, ModuleType] = {}
+    # Winning ASGI target per import path, tried first on the next initialisation
+    _RESOLVED_TARGETS: dict[str, str] = {}
+
     def __init__(
         self,
         *,
         import_path: Optional[str] = None,
-        expose_wrapper_app: bool = False,
     ) -> None:
-        import_path_value = import_path or os.getenv(
-            "DEEPEVAL_WRAPPER_IMPORT_PATH",
-            "app.main",
-        )
-        self.import_path = import_path_value.strip()
+        if not DeepevalWrapperClient._env_configured:
+            self._configure_wrapper_env()
+
+        self.import_path = self._resolve_import_path(import_path)
         self._timeout = float(os.getenv("DEEPEVAL_HTTP_TIMEOUT", "30"))
         self._module: Optional[ModuleType] = None
         self._transport: Optional[httpx.ASGITransport] = None
         self._client: Optional[httpx.AsyncClient] = None
+        self._do_request: Optional[Callable[..., Awaitable[httpx.Response]]] = None
+        # Wrapper routes that can be awaited directly, keyed by (method, path)
+        self._direct_routes: dict[tuple[str, str], APIRoute] = {}
         self._base_url = "http://deepeval-wrapper.local"
         self.wrapper_app: Optional[Any] = None  # Expose for mounting
+        self._ready_lock = asyncio.Lock()
+        self._closed = False
+
+    @classmethod
+    async def get(cls, import_path: Optional[str] = None) -> DeepevalWrapperClient:
+        """Return the process-wide client for ``import_path``, building it on first use."""
+        key = cls._resolve_import_path(import_path)
+        client = _SINGLETONS.get(key)
+        if client is None:
+            client = _SINGLETONS[key] = cls(import_path=key)
+        await client._ensure_ready()
+        return client
+
+    def mount(self, app: FastAPI, path: str = "/wrapper") -> None:
+        """Mount the wrapper's ASGI app on ``app`` so its endpoints are served directly."""
+        if self.wrapper_app is None:
+            raise DeepevalWrapperError("Wrapper app not initialised.")
+        app.mount(path, self.wrapper_app)
+
+    async def evaluate(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Execute the wrapper evaluate logic and return its dictionary payload."""
+        response = await self._request("POST", "/evaluate/", payload)
+        if not isinstance(response, dict):
+            raise DeepevalWrapperError("Unexpected evaluate response shape from wrapper")
+        return response
+
+    async def available_metrics(self) -> dict[str, Any]:
+        """Return the available metrics exposed by the wrapper."""
+        response = await self._request("GET", "/metrics/")
+        if not isinstance(response, dict):
+            raise DeepevalWrapperError("Unexpected metrics response shape from wrapper")
+        return response
+
+    async def close(self) -> None:
+        """Release any transport resources held by the client."""
+        if _SINGLETONS.get(self.import_path) is self:
+            del _SINGLETONS[self.import_path]
+        # Detach everything before awaiting so concurrent requests fail cleanly
+        # in _ensure_ready instead of calling a half-torn-down client.
+        self._closed = True
+        client, transport = self._client, self._transport
+        self._client = None
+        self._transport = None
+        self._do_request = None
+        self._direct_routes = {}
+        if client is not None:
+            await client.aclose()
+        if transport is not None:
+            await transport.aclose()
+
+    # Internal helpers --------------------------------------------------
+
+    @staticmethod
+    def _resolve_import_path(import_path: Optional[str]) -> str:
+        import_path_value = import_path or os.getenv(
+            "DEEPEVAL_WRAPPER_IMPORT_PATH",
+            "app.main",
+        )
+        return import_path_value.strip()
+
+    @classmethod
+    def _configure_wrapper_env(cls) -> None:
+        # SECURITY: Override the wrapper's insecure default API key
+        # The wrapper defaults to "deepeval-default-key" which is publicly known and insecure.
+        # If API_KEYS is not set, we set it to empty string to disable wrapper auth entirely.
+        # This is safer than leaving a known default key active.
+        if "API_KEYS" not in os.environ:
+            logger.warning(
+                "API_KEYS not set - disabling wrapper authentication by setting API_KEYS to empty string. "
+                "The wrapper's default 'deepeval-default-key' is publicly known and insecure. "
+                "Set API_KEYS in your .env file to enable authentication for /wrapper/* endpoints."
+            )
+            os.environ["API_KEYS"] = ""
+        DeepevalWrapperClient._env_configured = True
+
+    async def _ensure_ready(self) -> None:
+        """Import the wrapper and build the ASGI client exactly once."""
+        if self._client is not None:
+            return
+        if self._closed:
+            raise DeepevalWrapperError("Wrapper client is closed.")
+        async with self._ready_lock:
+            if self._closed:
+                raise DeepevalWrapperError("Wrapper client is closed.")
+            if self._client is None:
+                self._initialise()
+
+    def _initialise(self) -> None:
+        import httpx
 
         logger.info("Initialising DeepevalWrapperClient (import path=%s).", self.import_path)
-        logger.info("PYTHONPATH: %s", os.environ.get("PYTHONPATH", "not set"))
-        logger.info("Current working directory: %s", os.getcwd())
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("PYTHONPATH: %s", os.environ.get("PYTHONPATH", "not set"))
+            logger.debug("Current working directory: %s", os.getcwd())
 
         self._module = self._load_module(self.import_path)
         logger.info("Successfully loaded wrapper module: %s", self._module.__name__ if self._module else "None")
 
-        asgi_target = os.getenv("DEEPEVAL_WRAPPER_ASGI_TARGET")
-        wrapper_app: Optional[Any] = None
-        if asgi_target:
-            try:
-                logger.info("Importing ASGI app via environment target '%s'.", asgi_target)
-                wrapper_app = import_from_string(asgi_target)
-                logger.info("✓ Successfully loaded ASGI app from environment target")
-            except Exception as e:
-                logger.warning("✗ Failed to import ASGI target '%s': %s", asgi_target, str(e))
-                logger.debug("Exception details:", exc_info=True)
-
-        if wrapper_app is None:
-            # Try standard target based on import path
-            default_target = f"{self.import_path}:app" if self.import_path else None
-            if default_target:
-                try:
-                    logger.info("Trying default ASGI target: %s", default_target)
-                    wrapper_app = import_from_string(default_target)
-                    logger.info("✓ Successfully loaded ASGI app from default target")
-                except Exception as e:
-                    logger.warning("✗ Default target '%s' failed: %s", default_target, str(e))
-
-            # Also try common wrapper locations if above failed
-            if wrapper_app is None:
-                for fallback_target in ["app.main:app", "app:app"]:
-                    try:
-                        logger.info("Trying fallback ASGI target: %s", fallback_target)
-                        wrapper_app = import_from_string(fallback_target)
-                        logger.info("✓ Successfully loaded ASGI app from fallback target: %s", fallback_target)
-                        break
-                    except Exception as e:
-                        logger.warning("✗ Fallback target '%s' failed: %s", fallback_target, str(e))
-
-        if wrapper_app is None and self._module is not None:
-            logger.info("Attempting to extract ASGI app from module attributes...")
-            wrapper_app = self._extract_asgi_app(self._module)
-            if wrapper_app:
-                logger.info("✓ Extracted ASGI app from module")
-            else:
-                logger.warning("✗ Could not extract ASGI app from module")
-
+        wrapper_app = self._resolve_wrapper_app()
         if wrapper_app is None:
             raise DeepevalWrapperError(
                 f"Could not find FastAPI app in wrapper module '{self.import_path}'. "
@@ -117,9 +199,7 @@ class DeepevalWrapperClient:
         )
 
         # Store wrapper app for potential mounting
-        if expose_wrapper_app:
-            self.wrapper_app = wrapper_app
-            logger.info("Wrapper app exposed for direct mounting")
+        self.wrapper_app = wrapper_app
 
         self._transport = httpx.ASGITransport(app=wrapper_app)
         self._client = httpx.AsyncClient(
@@ -127,82 +207,122 @@ class DeepevalWrapperClient:
             base_url=self._base_url,
             timeout=self._timeout,
         )
+        # Bound once so the request path skips the attribute lookups
+        self._do_request = self._client.request
+        try:
+            self._direct_routes = self._find_direct_routes(wrapper_app)
+        except Exception:  # noqa: BLE001 - direct calls are an optimisation only
+            logger.warning("Wrapper route discovery failed; using ASGI for all calls.", exc_info=True)
+            self._direct_routes = {}
+
+    def _resolve_wrapper_app(self) -> Optional[Any]:
+        """Import the wrapper's ASGI app from the first target that resolves."""
+        from uvicorn.importer import import_from_string
+
+        targets: list[str] = []
+        resolved = self._RESOLVED_TARGETS.get(self.import_path)
+        if resolved:
+            targets.append(resolved)
+        asgi_target = os.getenv("DEEPEVAL_WRAPPER_ASGI_TARGET")
+        if asgi_target:
+            targets.append(asgi_target)
+        if self.import_path:
+            targets.append(f"{self.import_path}:app")
+        targets.extend(_FALLBACK_ASGI_TARGETS)
+
+        # Targets are imported on the loop thread, one at a time, stopping at the
+        # first success: wrapper modules may touch signal or the event loop at import.
+        # dict.fromkeys drops duplicates (e.g. import path 'app.main') while keeping order
+        for target in dict.fromkeys(targets):
+            try:
+                wrapper_app = import_from_string(target)
+            except Exception as e:
+                logger.debug("✗ ASGI target '%s' failed: %s", target, str(e))
+                continue
+            logger.info("✓ Loaded wrapper ASGI app from target '%s'.", target)
+            self._RESOLVED_TARGETS[self.import_path] = target
+            return wrapper_app
 
-    async def evaluate(self, payload: dict[str, Any]) -> dict[str, Any]:
-        """Execute the wrapper evaluate logic via ASGI and return its dictionary payload."""
-        response = await self._asgi_request("POST", "/evaluate/", payload)
-        if not isinstance(response, dict):
-            raise DeepevalWrapperError("Unexpected evaluate response shape from wrapper")
-        return response
-
-    async def available_metrics(self) -> dict[str, Any]:
-        """Return the available metrics exposed by the wrapper via ASGI."""
-        response = await self._asgi_request("GET", "/metrics/")
-        if not isinstance(response, dict):
-            raise DeepevalWrapperError("Unexpected metrics response shape from wrapper")
-        return response
-
-    async def close(self) -> None:
-        """Release any transport resources held by the client."""
-        if self._client is not None:
-            await self._client.aclose()
-            self._client = None
-        if self._transport is not None:
-            await self._transport.aclose()
-            self._transport = None
-
-    # Internal helpers --------------------------------------------------
+        if self._module is not None:
+            wrapper_app = self._extract_asgi_app(self._module)
+            if wrapper_app is not None:
+                logger.info("✓ Extracted ASGI app from module '%s'.", self._module.__name__)
+                return wrapper_app
+            logger.warning("✗ Could not extract ASGI app from module '%s'.", self._module.__name__)
+        return None
 
     def _load_module(self, import_path: str) -> ModuleType:
+        cached = self._MODULE_CACHE.get(import_path)
+        if cached is not None:
+            logger.debug("Using cached wrapper module %s for '%s'.", cached.__name__, import_path)
+            return cached
+
         candidates: list[str] = []
         if import_path:
             candidates.append(import_path)
         # Due to PYTHONPATH=/app:/app/deepeval_wrapper, the wrapper is importable as 'app.main'
         candidates.extend(["app.main", "app", "deepeval_wrapper.app.main"])
         candidates.append("deepeval_wrapper.api")
+        candidates = list(dict.fromkeys(candidates))
 
-        last_tb: Optional[str] = None
+        failures: list[tuple[str, str]] = []
+        last_exc: Optional[BaseException] = None
         for mod in candidates:
             try:
-                logger.info("Attempting to import wrapper module: %s", mod)
-                module = importlib.import_module(mod)
+                module = sys.modules.get(mod)
+                if module is None:
+                    # Probe with find_spec first so missing candidates are skipped
+                    # without running the full import machinery.
+                    try:
+                        spec = importlib.util.find_spec(mod)
+                    except (ImportError, ValueError) as e:
+                        spec = None
+                        failures.append((mod, str(e)))
+                    else:
+                        if spec is None:
+                            failures.append((mod, "module not found"))
+                    if spec is None:
+                        logger.warning("✗ Wrapper module '%s' not found.", mod)
+                        continue
+                    logger.info("Attempting to import wrapper module: %s", mod)
+                    module = importlib.import_module(mod)
                 logger.info("✓ Successfully imported wrapper module: %s", mod)
-                logger.info("Module file location: %s", getattr(module, "__file__", "unknown"))
-                logger.info("Module attributes: %s", [x for x in dir(module) if not x.startswith("_")])
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Module file location: %s", getattr(module, "__file__", "unknown"))
+                    logger.debug("Module attributes: %s", [x for x in dir(module) if not x.startswith("_")])
+                self._MODULE_CACHE[import_path] = module
                 return module
             except Exception as e:
-                last_tb = traceback.format_exc()
+                last_exc = e
+                failures.append((mod, str(e)))
                 logger.warning("✗ Import of '%s' failed: %s", mod, str(e))
-                logger.debug("Full traceback for '%s':\n%s", mod, last_tb)
 
-        raise DeepevalWrapperError(
-            f"Unable to import deepeval wrapper module. Tried: {candidates}. "
-            "Set DEEPEVAL_WRAPPER_IMPORT_PATH to a valid module. "
-            f"Last error:\n{last_tb}"
+        reasons = "; ".join(f"{mod}: {reason}" for mod, reason in failures)
+        message = (
+            f"Unable to import deepeval wrapper module. Tried: {reasons}. "
+            "Set DEEPEVAL_WRAPPER_IMPORT_PATH to a valid module."
         )
+        if last_exc is not None:
+            last_tb = "".join(traceback.format_exception(type(last_exc), last_exc, last_exc.__traceback__))
+            message += f" Last error:\n{last_tb}"
+        raise DeepevalWrapperError(message)
 
     def _extract_asgi_app(self, module: ModuleType) -> Optional[FastAPI]:
-        def _is_asgi(candidate: Any) -> bool:
-            return callable(candidate) and hasattr(candidate, "__call__")
-
-        app_attr = getattr(module, "app", None)
-        if _is_asgi(app_attr):
-            logger.debug("Found ASGI application as 'app' attribute on module '%s'.", module.__name__)
-            return app_attr  # type: ignore[return-value]
+        from fastapi import FastAPI
 
-        for attr_name in dir(module):
-            if attr_name.startswith("_"):
-                continue
-            attr = getattr(module, attr_name)
-            if isinstance(attr, FastAPI) or _is_asgi(attr):
+        # Probe well-known names directly instead of walking dir(module), which
+        # would evaluate every module attribute.
+        for attr_name in _ASGI_APP_ATTRS:
+            attr = getattr(module, attr_name, None)
+            if isinstance(attr, FastAPI) or callable(attr):
                 logger.debug(
-                    "Detected ASGI-compatible attribute '%s' in module '%s'.",
+                    "Found ASGI application as '%s' attribute on module '%s'.",
                     attr_name,
                     module.__name__,
                 )
                 return attr  # type: ignore[return-value]
 
-        for factory_name in ("create_app", "build_app", "get_app"):  # type: ignore[return-value]
+        for factory_name in _ASGI_APP_FACTORIES:
             factory = getattr(module, factory_name, None)
             if callable(factory):
                 try:
@@ -215,7 +335,7 @@ class DeepevalWrapperClient:
                         exc_info=True,
                     )
                     continue
-                if _is_asgi(candidate):
+                if isinstance(candidate, FastAPI) or callable(candidate):
                     logger.debug(
                         "Using ASGI app returned by '%s' in module '%s'.",
                         factory_name,
@@ -224,27 +344,159 @@ class DeepevalWrapperClient:
                     return candidate
 
         logger.debug(
-            "No ASGI application detected in module '%s'. Attributes: %s",
+            "No ASGI application detected in module '%s'. Tried attributes %s and factories %s.",
             module.__name__,
-            sorted(attr for attr in dir(module) if not attr.startswith("_")),
+            _ASGI_APP_ATTRS,
+            _ASGI_APP_FACTORIES,
         )
         return None
 
-    async def _asgi_request(self, method: str, path: str, payload: Optional[dict[str, Any]] = None) -> dict[str, Any]:
-        if self._client is None:
-            raise DeepevalWrapperError("ASGI transport not initialised.")
+    def _find_direct_routes(self, wrapper_app: Any) -> dict[tuple[str, str], APIRoute]:
+        """Return the wrapper routes that can be awaited without an ASGI round-trip.
+
+        Only plain FastAPI routes qualify: no middleware or custom exception
+        handlers on the wrapper app, no dependencies, and at most one
+        non-embedded body parameter. Anything else keeps going through ASGI so
+        auth and request handling stay intact.
+        """
+        from fastapi import FastAPI
+        from fastapi.exception_handlers import (
+            http_exception_handler,
+            request_validation_exception_handler,
+            websocket_request_validation_exception_handler,
+        )
+        from fastapi.exceptions import RequestValidationError, WebSocketRequestValidationError
+        from fastapi.routing import APIRoute
+        from starlette.exceptions import HTTPException
+
+        if not isinstance(wrapper_app, FastAPI) or wrapper_app.user_middleware:
+            return {}
+        default_handlers = {
+            HTTPException: http_exception_handler,
+            RequestValidationError: request_validation_exception_handler,
+            WebSocketRequestValidationError: websocket_request_validation_exception_handler,
+        }
+        if wrapper_app.exception_handlers != default_handlers:
+            logger.debug("Wrapper app registers custom exception handlers; using ASGI for all routes.")
+            return {}
 
+        routes: dict[tuple[str, str], APIRoute] = {}
+        for route in wrapper_app.routes:
+            if not isinstance(route, APIRoute):
+                continue
+            for key in _DIRECT_ROUTE_KEYS:
+                method, path = key
+                if route.path != path or method not in route.methods or key in routes:
+                    continue
+                dependant = route.dependant
+                if (
+                    dependant.dependencies
+                    or dependant.path_params
+                    or dependant.query_params
+                    or dependant.header_params
+                    or dependant.cookie_params
+                    or dependant.request_param_name
+                    or dependant.http_connection_param_name
+                    or dependant.response_param_name
+                    or dependant.background_tasks_param_name
+                    or len(dependant.body_params) > 1
+                    or any(getattr(f.field_info, "embed", None) for f in dependant.body_params)
+                ):
+                    logger.debug("Wrapper route %s %s needs full ASGI handling.", method, path)
+                    continue
+                routes[key] = route
+        if routes:
+            logger.info("Calling wrapper routes directly: %s", sorted(f"{m} {p}" for m, p in routes))
+        return routes
+
+    async def _request(self, method: str, path: str, payload: Optional[dict[str, Any]] = None) -> Any:
+        await self._ensure_ready()
+        route = self._direct_routes.get((method, path))
+        if route is None:
+            return await self._asgi_request(method, path, payload)
+        return await self._direct_request(route, payload)
+
+    async def _direct_request(self, route: APIRoute, payload: Optional[dict[str, Any]]) -> Any:
+        """Await a wrapper endpoint in-process, mirroring FastAPI's request handling.
+
+        Error details match the JSON bodies FastAPI's default exception handlers
+        would have returned over ASGI, and unhandled endpoint exceptions
+        propagate just as ASGITransport re-raises them.
+        """
+        from fastapi.routing import serialize_response
+        from starlette.concurrency import run_in_threadpool
+        from starlette.exceptions import HTTPException
+        from starlette.responses import Response
+
+        dependant = route.dependant
+        values: dict[str, Any] = {}
+        if dependant.body_params:
+            field = dependant.body_params[0]
+            value, errors = field.validate(payload, {}, loc=("body",))
+            if errors:
+                from fastapi.encoders import jsonable_encoder
+
+                detail = orjson.dumps({"detail": jsonable_encoder(errors)}).decode("utf-8")
+                logger.error("Wrapper returned error 422: %s", detail)
+                raise DeepevalWrapperError(f"HTTP error from deepeval wrapper (422): {detail}")
+            values[field.name] = value
+
+        is_coroutine = asyncio.iscoroutinefunction(dependant.call)
         try:
-            logger.info("ASGI request to wrapper: %s %s (payload keys: %s)",
-                       method.upper(), path, list(payload.keys()) if payload else None)
-            response = await self._client.request(method, path, json=payload)
-            logger.info(
-                "ASGI response from wrapper: status=%s, content_length=%d",
-                response.status_code,
-                len(response.content),
+            if is_coroutine:
+                raw = await dependant.call(**values)  # type: ignore[misc]
+            else:
+                raw = await run_in_threadpool(dependant.call, **values)  # type: ignore[arg-type]
+            if isinstance(raw, Response):
+                if raw.status_code >= 400:
+                    raise DeepevalWrapperError(
+                        f"HTTP error from deepeval wrapper ({raw.status_code}): "
+                        f"{bytes(raw.body).decode('utf-8', 'replace')}"
+                    )
+                return orjson.loads(raw.body) if raw.body else {}
+            return await serialize_response(
+                field=route.response_field,
+                response_content=raw,
+                include=route.response_model_include,
+                exclude=route.response_model_exclude,
+                by_alias=route.response_model_by_alias,
+                exclude_unset=route.response_model_exclude_unset,
+                exclude_defaults=route.response_model_exclude_defaults,
+                exclude_none=route.response_model_exclude_none,
+                is_coroutine=is_coroutine,
             )
+        except HTTPException as exc:
+            detail = orjson.dumps({"detail": exc.detail}).decode("utf-8")
+            logger.error("Wrapper returned error %s: %s", exc.status_code, detail)
+            raise DeepevalWrapperError(
+                f"HTTP error from deepeval wrapper ({exc.status_code}): {detail}"
+            ) from exc
+
+    async def _asgi_request(self, method: str, path: str, payload: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+        import httpx
+
+        await self._ensure_ready()
+        method_upper = method.upper()
+
+        try:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("ASGI request to wrapper: %s %s (payload keys: %s)",
+                           method_upper, path, None if payload is None else list(payload))
+            if payload is None:
+                response = await self._do_request(method, path)  # type: ignore[misc]
+            else:
+                # Serialise ourselves: UTF-8 output instead of httpx's ASCII-escaped json=
+                response = await self._do_request(  # type: ignore[misc]
+                    method, path, content=_dump_payload(payload), headers=_JSON_HEADERS
+                )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "ASGI response from wrapper: status=%s, content_length=%s",
+                    response.status_code,
+                    response.headers.get("content-length") or "?",
+                )
         except httpx.TimeoutException as exc:
-            logger.error("Wrapper ASGI request timed out (%s %s).", method.upper(), path)
+            logger.error("Wrapper ASGI request timed out (%s %s).", method_upper, path)
             raise DeepevalWrapperError("Wrapper request timed out.") from exc
         except httpx.HTTPError as exc:
             logger.error("Wrapper ASGI request failed.", exc_info=True)
@@ -262,9 +514,14 @@ class DeepevalWrapperClient:
             return {}
 
         try:
-            result = response.json()
-            logger.info("Wrapper response parsed successfully, keys: %s", list(result.keys()) if isinstance(result, dict) else type(result))
+            result = orjson.loads(response.content)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Wrapper response parsed successfully, keys: %s", list(result.keys()) if isinstance(result, dict) else type(result))
             return result
         except ValueError as exc:
-            logger.error("Failed to parse wrapper response as JSON: %s", response.text[:200])
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error(
+                    "Failed to parse wrapper response as JSON: %s",
+                    response.content[:200].decode("utf-8", "replace"),
+                )
             raise DeepevalWrapperError("Wrapper returned invalid JSON.") from exc
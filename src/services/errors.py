@@ -0,0 +1,7 @@
+"""Exceptions shared by the service layer."""
+
+from __future__ import annotations
+
+
+class DeepevalWrapperError(RuntimeError):
+    """Raised when the deepeval wrapper cannot be reached or returns an error."""